@@ -30,6 +30,8 @@ from typing import Any
 import yaml
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
+from mcp_skills.services.validators import load_frontmatter_yaml
+
 
 logger = logging.getLogger(__name__)
 
@@ -299,7 +301,7 @@ class SkillBuilder:
 
             # Parse YAML frontmatter
             try:
-                frontmatter = yaml.safe_load(frontmatter_yaml)
+                frontmatter = load_frontmatter_yaml(frontmatter_yaml)
                 if not isinstance(frontmatter, dict):
                     errors.append("Frontmatter must be a YAML dictionary")
                     return ValidationResult(
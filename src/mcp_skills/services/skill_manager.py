@@ -17,6 +17,7 @@ from mcp_skills.services.validators import (
     SkillValidator,
     ThreatLevel,
     TrustLevel,
+    load_frontmatter_yaml,
 )
 
 
@@ -64,6 +65,9 @@ class SkillManager:
         self._skill_paths: dict[str, Path] = {}  # Map skill_id -> file_path
         self.validator = SkillValidator()
         self.enable_security = enable_security
+        # One security validator per trust level, so scan results are reused
+        # across reindexing for the lifetime of this manager
+        self._security_validators: dict[TrustLevel, SkillSecurityValidator] = {}
 
         # Trusted repositories (minimal security filtering)
         self._trusted_repos = {
@@ -311,10 +315,12 @@ class SkillManager:
             Dictionary with validation results:
             {
                 "errors": ["Critical errors that prevent skill usage"],
-                "warnings": ["Non-critical warnings for improvement"]
+                "warnings": ["Non-critical warnings for improvement"],
+                "error_codes": ["Stable code for each error, in order"],
+                "warning_codes": ["Stable code for each warning, in order"]
             }
 
-        Validation Rules:
+        Validation Rules (see SkillValidator.validate_skill for codes):
         - ERRORS (critical):
             - Missing required fields: name, description, instructions
             - Invalid YAML frontmatter
@@ -418,11 +424,13 @@ class SkillManager:
     def clear_cache(self) -> None:
         """Clear in-memory skill cache.
 
-        Clears both the skill object cache and skill path cache.
+        Clears the skill object cache, skill path cache, and the security
+        validators holding cached scan results.
         Call this after repository updates to ensure fresh data.
         """
         self._skill_cache.clear()
         self._skill_paths.clear()
+        self._security_validators.clear()
 
     # Private helper methods
 
@@ -463,7 +471,7 @@ class SkillManager:
                 return None
 
             # Parse YAML frontmatter
-            metadata = yaml.safe_load(frontmatter)
+            metadata = load_frontmatter_yaml(frontmatter)
             if not isinstance(metadata, dict):
                 logger.error(f"Invalid frontmatter format in {file_path}")
                 return None
@@ -628,7 +636,7 @@ class SkillManager:
 
         Security Workflow:
         1. Determine repository trust level
-        2. Create security validator with trust level
+        2. Get the security validator for the trust level
         3. Validate skill content for threats
         4. Log violations and block if necessary
         5. Sanitize content with boundaries
@@ -653,8 +661,11 @@ class SkillManager:
         # Determine trust level
         trust_level = self._get_trust_level(skill.repo_id)
 
-        # Create security validator
-        security_validator = SkillSecurityValidator(trust_level=trust_level)
+        # Reuse the security validator for this trust level
+        security_validator = self._security_validators.get(trust_level)
+        if security_validator is None:
+            security_validator = SkillSecurityValidator(trust_level=trust_level)
+            self._security_validators[trust_level] = security_validator
 
         # Validate skill content
         is_safe, violations = security_validator.validate_skill(
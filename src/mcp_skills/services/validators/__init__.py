@@ -6,7 +6,7 @@ from .security_validator import (
     ThreatLevel,
     TrustLevel,
 )
-from .skill_validator import SkillValidator
+from .skill_validator import SkillValidator, load_frontmatter_yaml
 
 
 __all__ = [
@@ -15,4 +15,5 @@ __all__ = [
     "SecurityViolation",
     "ThreatLevel",
     "TrustLevel",
+    "load_frontmatter_yaml",
 ]
@@ -23,10 +23,18 @@ References:
 - Prompt Injection Taxonomy: https://simonwillison.net/2023/Apr/14/worst-that-can-happen/
 """
 
+import bisect
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from re import _constants as sre_constants  # type: ignore[attr-defined]
+from re import _parser as sre_parse  # type: ignore[attr-defined]
+from typing import Any, ClassVar, NamedTuple
 
 
 logger = logging.getLogger(__name__)
@@ -68,10 +76,29 @@ class TrustLevel(Enum):
     UNTRUSTED = "untrusted"
 
 
-@dataclass
+# Integer severity of each threat level, so trust filtering compares ints
+_THREAT_RANK: dict[ThreatLevel, int] = {
+    ThreatLevel.SAFE: 0,
+    ThreatLevel.SUSPICIOUS: 1,
+    ThreatLevel.DANGEROUS: 2,
+    ThreatLevel.BLOCKED: 3,
+}
+
+# Lowest threat rank that blocks a skill at each trust level
+_MIN_BLOCK_RANK: dict[TrustLevel, int] = {
+    TrustLevel.TRUSTED: _THREAT_RANK[ThreatLevel.BLOCKED],
+    TrustLevel.VERIFIED: _THREAT_RANK[ThreatLevel.DANGEROUS],
+    TrustLevel.UNTRUSTED: _THREAT_RANK[ThreatLevel.SUSPICIOUS],
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SecurityViolation:
     """Detected security issue in skill content.
 
+    Immutable and slotted: several are allocated per validation call, and
+    frozen instances are hashable so they can be deduplicated or cached.
+
     Attributes:
         pattern: Regex pattern or rule that detected the issue
         location: Where the violation was found (skill_id, section)
@@ -89,6 +116,21 @@ class SecurityViolation:
     context: str = ""
 
 
+class _PatternHit(NamedTuple):
+    """Pattern match independent of skill ID and trust level.
+
+    Cached per unique content and turned into SecurityViolation objects
+    for each validate_skill call.
+    """
+
+    pattern: str
+    line: int
+    threat_level: ThreatLevel
+    description: str
+    suggestion: str
+    context: str
+
+
 class SkillSecurityValidator:
     """Validates skill content for security threats.
 
@@ -177,6 +219,23 @@ class SkillSecurityValidator:
     MAX_DESCRIPTION_SIZE = 500  # 500 chars for description
     MAX_INSTRUCTION_SIZE = 50_000  # 50KB for instructions
 
+    # Compiled pattern rules, built once per class from the tables above
+    _injection_rules: ClassVar[tuple["_PatternRule", ...]]
+    _suspicious_rules: ClassVar[tuple["_PatternRule", ...]]
+    # Union of all rule anchors, and whether every rule has one (so content
+    # containing no anchor cannot match any pattern)
+    _trigger_hints: ClassVar[frozenset[str]]
+    _fully_anchored: ClassVar[bool]
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Compile the pattern rules of a subclass.
+
+        Subclasses may override INJECTION_PATTERNS or SUSPICIOUS_PATTERNS;
+        their rules are compiled once, here.
+        """
+        super().__init_subclass__(**kwargs)
+        _compile_rules(cls)
+
     def __init__(self, trust_level: TrustLevel = TrustLevel.UNTRUSTED):
         """Initialize security validator with trust level.
 
@@ -184,6 +243,11 @@ class SkillSecurityValidator:
             trust_level: Repository trust level for filtering rules
         """
         self.trust_level = trust_level
+        # LRU cache of pattern hits keyed by _scan_cache_key()
+        self._scan_cache: OrderedDict[
+            str | tuple[int, bytes], tuple[_PatternHit, ...]
+        ] = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
 
     def validate_skill(
         self,
@@ -213,6 +277,7 @@ class SkillSecurityValidator:
         - TRUSTED repos: Only block BLOCKED-level threats
         - VERIFIED repos: Block BLOCKED and DANGEROUS threats
         - UNTRUSTED repos: Block all threats (BLOCKED, DANGEROUS, SUSPICIOUS)
+        - Oversized content: Blocked at every trust level without scanning
 
         Example:
             >>> validator = SkillSecurityValidator(TrustLevel.UNTRUSTED)
@@ -226,16 +291,30 @@ class SkillSecurityValidator:
             >>> violations[0].threat_level
             ThreatLevel.BLOCKED
         """
-        violations: list[SecurityViolation] = []
-
         # Layer 1: Size limit checks (DoS prevention)
-        violations.extend(self._check_size_limits(instructions, description, skill_id))
-
-        # Layer 2: Prompt injection detection
-        violations.extend(self._check_injection_patterns(instructions, skill_id))
+        # Runs before any pattern scanning so oversized payloads never reach
+        # the regex engine
+        violations = self._check_size_limits(instructions, description, skill_id)
+        if violations:
+            logger.warning(
+                f"Security scan for {skill_id}: content exceeds size limits, "
+                f"skipping pattern scan"
+            )
+            return False, violations
 
-        # Layer 3: Suspicious content detection
-        violations.extend(self._check_suspicious_content(instructions, skill_id))
+        # Layers 2-3: Pattern scanning of the instructions (memoized per
+        # unique content)
+        for hit in self._scan_cached(instructions):
+            violations.append(
+                SecurityViolation(
+                    pattern=hit.pattern,
+                    location=f"skill:{skill_id}:line_{hit.line}",
+                    threat_level=hit.threat_level,
+                    description=hit.description,
+                    suggestion=hit.suggestion,
+                    context=hit.context,
+                )
+            )
 
         # Layer 4: Apply trust level filtering
         is_safe = self._apply_trust_filtering(violations)
@@ -267,6 +346,9 @@ class SkillSecurityValidator:
         2. Slow down loading and processing
         3. Hide malicious content in padding
 
+        Size violations are BLOCKED: oversized content is rejected without
+        pattern scanning, so it must fail at every trust level.
+
         Args:
             instructions: Skill instructions
             description: Skill description
@@ -283,7 +365,7 @@ class SkillSecurityValidator:
                 SecurityViolation(
                     pattern="size_limit_instructions",
                     location=f"skill:{skill_id}:instructions",
-                    threat_level=ThreatLevel.SUSPICIOUS,
+                    threat_level=ThreatLevel.BLOCKED,
                     description=f"Instructions exceed {self.MAX_INSTRUCTION_SIZE} chars ({len(instructions)} chars)",
                     suggestion="Skill may be too large or contain padding for injection attacks",
                 )
@@ -295,7 +377,7 @@ class SkillSecurityValidator:
                 SecurityViolation(
                     pattern="size_limit_description",
                     location=f"skill:{skill_id}:description",
-                    threat_level=ThreatLevel.SUSPICIOUS,
+                    threat_level=ThreatLevel.BLOCKED,
                     description=f"Description exceeds {self.MAX_DESCRIPTION_SIZE} chars ({len(description)} chars)",
                     suggestion="Description should be concise; excessive length is suspicious",
                 )
@@ -308,7 +390,7 @@ class SkillSecurityValidator:
                 SecurityViolation(
                     pattern="size_limit_total",
                     location=f"skill:{skill_id}",
-                    threat_level=ThreatLevel.SUSPICIOUS,
+                    threat_level=ThreatLevel.BLOCKED,
                     description=f"Total size exceeds {self.MAX_SKILL_SIZE} chars ({total_size} chars)",
                     suggestion="Unusually large skill may indicate malicious padding",
                 )
@@ -316,11 +398,79 @@ class SkillSecurityValidator:
 
         return violations
 
+    def _scan_cached(self, instructions: str) -> tuple[_PatternHit, ...]:
+        """Scan content for threat patterns, reusing results for repeated content.
+
+        Pattern hits depend only on the content, not on the skill ID or trust
+        level, so each validator caches them per unique content (see
+        _scan_cache_key). The cache lives and dies with the validator, so
+        results never leak between instances.
+
+        Args:
+            instructions: Skill instructions to scan
+
+        Returns:
+            Tuple of pattern hits (empty if content is clean)
+        """
+        key = _scan_cache_key(instructions)
+
+        with self._scan_cache_lock:
+            hits = self._scan_cache.get(key)
+            if hits is not None:
+                self._scan_cache.move_to_end(key)
+                return hits
+
+        hits = self._scan_patterns(instructions)
+
+        with self._scan_cache_lock:
+            self._scan_cache[key] = hits
+            if len(self._scan_cache) > _SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+
+        return hits
+
+    def _scan_patterns(self, content: str) -> tuple[_PatternHit, ...]:
+        """Run injection and suspicious pattern detection over content.
+
+        Args:
+            content: Text to scan (instructions)
+
+        Returns:
+            Tuple of pattern hits in detection order
+        """
+        # Patterns are matched case-insensitively against the original text;
+        # the folded copy lines up with it character for character, so
+        # anchors, literals and seek prefixes can be found in it with str.find
+        content_lower = _fold_case(content)
+
+        # Test each distinct anchor once; rules are gated by set lookups.
+        # Fast path: skip pattern scanning when no anchor is present
+        present = frozenset(
+            hint for hint in self._trigger_hints if hint in content_lower
+        )
+        if not present and self._fully_anchored:
+            return ()
+
+        # Newline offsets are found once so each hit's line is a bisect
+        newlines = _newline_offsets(content)
+
+        # Layer 2: Prompt injection detection
+        hits = self._check_injection_patterns(content, content_lower, newlines, present)
+
+        # Layer 3: Suspicious content detection
+        hits.extend(
+            self._check_suspicious_content(content, content_lower, newlines, present)
+        )
+
+        return tuple(hits)
+
     def _check_injection_patterns(
         self,
         content: str,
-        skill_id: str,
-    ) -> list[SecurityViolation]:
+        content_lower: str,
+        newlines: list[int],
+        present: frozenset[str],
+    ) -> list[_PatternHit]:
         """Check for prompt injection attack patterns.
 
         Scans content for known injection techniques:
@@ -332,46 +482,44 @@ class SkillSecurityValidator:
 
         Args:
             content: Text to scan (instructions)
-            skill_id: Skill identifier for location tracking
+            content_lower: Case-folded content (see _fold_case)
+            newlines: Sorted offsets of every newline in content
+            present: Anchors that occur in content_lower
 
         Returns:
-            List of injection-related violations
+            List of injection-related pattern hits
         """
-        violations: list[SecurityViolation] = []
-        content_lower = content.lower()
-
-        for pattern, threat_level in self.INJECTION_PATTERNS.items():
-            # Search case-insensitive
-            for match in re.finditer(
-                pattern, content_lower, re.IGNORECASE | re.MULTILINE
-            ):
-                # Extract context (50 chars before and after)
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end].strip()
-
-                # Truncate context if too long
-                if len(context) > 150:
-                    context = context[:150] + "..."
-
-                violations.append(
-                    SecurityViolation(
-                        pattern=pattern,
-                        location=f"skill:{skill_id}:line_{self._get_line_number(content, match.start())}",
-                        threat_level=threat_level,
-                        description=f"Prompt injection pattern detected: '{match.group()}'",
+        hits: list[_PatternHit] = []
+
+        for rule in self._injection_rules:
+            # Skip the regex when none of its literal anchors are present
+            # (rules without anchors always run)
+            if rule.anchors and present.isdisjoint(rule.anchors):
+                continue
+
+            for start, end in _find_spans(rule, content, content_lower):
+                hits.append(
+                    self._make_hit(
+                        content,
+                        newlines,
+                        start,
+                        end,
+                        pattern=rule.pattern,
+                        threat_level=rule.threat_level,
+                        description=f"Prompt injection pattern detected: '{content[start:end]}'",
                         suggestion="Remove instruction override attempts. This pattern is commonly used in attacks.",
-                        context=f"...{context}...",
                     )
                 )
 
-        return violations
+        return hits
 
     def _check_suspicious_content(
         self,
         content: str,
-        skill_id: str,
-    ) -> list[SecurityViolation]:
+        content_lower: str,
+        newlines: list[int],
+        present: frozenset[str],
+    ) -> list[_PatternHit]:
         """Check for suspicious but potentially legitimate patterns.
 
         These patterns may be valid in some contexts but require review:
@@ -380,36 +528,94 @@ class SkillSecurityValidator:
         - Code execution functions (could be teaching material)
 
         Args:
-            content: Text to scan
-            skill_id: Skill identifier
+            content: Text to scan (instructions)
+            content_lower: Case-folded content (see _fold_case)
+            newlines: Sorted offsets of every newline in content
+            present: Anchors that occur in content_lower
 
         Returns:
-            List of suspicious content violations
+            List of suspicious content pattern hits
         """
-        violations: list[SecurityViolation] = []
-
-        for pattern, description in self.SUSPICIOUS_PATTERNS.items():
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                # Extract context
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end].strip()
-
-                if len(context) > 150:
-                    context = context[:150] + "..."
-
-                violations.append(
-                    SecurityViolation(
-                        pattern=pattern,
-                        location=f"skill:{skill_id}:line_{self._get_line_number(content, match.start())}",
-                        threat_level=ThreatLevel.SUSPICIOUS,
-                        description=description,
+        hits: list[_PatternHit] = []
+
+        for rule in self._suspicious_rules:
+            if rule.anchors and present.isdisjoint(rule.anchors):
+                continue
+
+            for start, end in _find_spans(rule, content, content_lower):
+                hits.append(
+                    self._make_hit(
+                        content,
+                        newlines,
+                        start,
+                        end,
+                        pattern=rule.pattern,
+                        threat_level=rule.threat_level,
+                        description=rule.description,
                         suggestion="Review context to ensure legitimate use case",
-                        context=f"...{context}...",
                     )
                 )
 
-        return violations
+        return hits
+
+    def _make_hit(
+        self,
+        content: str,
+        newlines: list[int],
+        start: int,
+        end: int,
+        pattern: str,
+        threat_level: ThreatLevel,
+        description: str,
+        suggestion: str,
+    ) -> _PatternHit:
+        """Build a pattern hit with line number and context.
+
+        Args:
+            content: Scanned text (instructions)
+            newlines: Sorted offsets of every newline in content
+            start: Offset of the match within content
+            end: End offset of the match within content
+            pattern: Pattern source that matched
+            threat_level: Severity of the pattern
+            description: Human-readable description of the threat
+            suggestion: Recommendation for remediation
+
+        Returns:
+            Pattern hit for the match
+        """
+        return _PatternHit(
+            pattern=pattern,
+            line=self._get_line_number(newlines, start),
+            threat_level=threat_level,
+            description=description,
+            suggestion=suggestion,
+            context=self._extract_context(content, start, end),
+        )
+
+    def _extract_context(self, content: str, start: int, end: int) -> str:
+        """Extract the text surrounding a match for violation reports.
+
+        Context is computed when the hit is built rather than lazily on
+        access: hits are cached by content digest so that the cache never
+        pins full skill bodies, and each unique hit is sliced only once.
+
+        Args:
+            content: Scanned text (instructions)
+            start: Offset of the match within content
+            end: End offset of the match within content
+
+        Returns:
+            Up to 50 characters either side of the match
+        """
+        context = content[max(0, start - 50) : min(len(content), end + 50)]
+        context = context.strip()
+
+        # Truncate context if too long
+        if len(context) > 150:
+            context = context[:150] + "..."
+
+        return f"...{context}..."
 
     def _apply_trust_filtering(self, violations: list[SecurityViolation]) -> bool:
         """Apply trust-level based filtering to violations.
@@ -428,24 +634,10 @@ class SkillSecurityValidator:
         if not violations:
             return True  # No violations = safe
 
-        # Check for blocking conditions based on trust level
-        if self.trust_level == TrustLevel.TRUSTED:
-            # Trusted repos: only block BLOCKED level
-            has_blocked = any(v.threat_level == ThreatLevel.BLOCKED for v in violations)
-            return not has_blocked
-
-        elif self.trust_level == TrustLevel.VERIFIED:
-            # Verified repos: block BLOCKED and DANGEROUS
-            has_serious_threat = any(
-                v.threat_level in (ThreatLevel.BLOCKED, ThreatLevel.DANGEROUS)
-                for v in violations
-            )
-            return not has_serious_threat
-
-        else:  # UNTRUSTED
-            # Untrusted repos: block any non-SAFE threat
-            has_any_threat = any(v.threat_level != ThreatLevel.SAFE for v in violations)
-            return not has_any_threat
+        # Block when any violation reaches the trust level's minimum rank
+        # (looked up per call so a reassigned trust_level takes effect)
+        min_block_rank = _MIN_BLOCK_RANK[self.trust_level]
+        return all(_THREAT_RANK[v.threat_level] < min_block_rank for v in violations)
 
     def sanitize_skill(self, instructions: str, skill_id: str) -> str:
         """Sanitize skill content by wrapping in clear boundaries.
@@ -482,14 +674,447 @@ class SkillSecurityValidator:
 
         return sanitized
 
-    def _get_line_number(self, content: str, position: int) -> int:
+    def _get_line_number(self, newlines: list[int], position: int) -> int:
         """Get line number for a character position in content.
 
         Args:
-            content: Full text content
+            newlines: Sorted offsets of every newline in the content
             position: Character position
 
         Returns:
             Line number (1-indexed)
         """
-        return content[:position].count("\n") + 1
+        return bisect.bisect_left(newlines, position) + 1
+
+
+def _newline_offsets(text: str) -> list[int]:
+    """Return the offset of every newline in text, in ascending order.
+
+    Computed once per scan so that locating K hits costs O(N + K log N)
+    instead of re-counting newlines from the start for every hit.
+
+    Args:
+        text: Text to index
+
+    Returns:
+        Sorted list of newline offsets
+    """
+    offsets: list[int] = []
+    pos = text.find("\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = text.find("\n", pos + 1)
+    return offsets
+
+
+@dataclass(slots=True, frozen=True)
+class _PatternRule:
+    """One threat pattern, compiled, with the shortcuts derived from it.
+
+    Everything but the pattern's level or description is derived from its
+    source by _compile_rule, so a pattern is only ever edited in the class
+    tables. Hits and violations reference the pattern and description
+    strings held here, so every violation of a rule shares the same objects
+    (sys.intern would add nothing).
+
+    Attributes:
+        pattern: Pattern source, as written in the class table
+        regex: Pattern compiled case-insensitively (used for any text)
+        threat_level: Severity of a match
+        description: Human-readable description (empty: described by the
+            matched text)
+        anchors: Lowercased literals, one of which occurs in the folded
+            text of every match (empty: the rule always runs)
+        literals: Every string the pattern can match, lowercased, if it
+            only matches fixed text (located with str.find)
+        prefixes: Lowercased literals every match starts with (the regex
+            is only tried where one occurs)
+    """
+
+    pattern: str
+    regex: re.Pattern[str]
+    threat_level: ThreatLevel
+    description: str
+    anchors: tuple[str, ...]
+    literals: tuple[str, ...]
+    prefixes: tuple[str, ...]
+
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters. str.lower()
+# keeps 'ı' (U+0131) and 'ſ' (U+017F) and lengthens 'İ' (U+0130), so these are
+# mapped before lowercasing
+_IGNORECASE_FOLD = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
+
+def _fold_case(text: str) -> str:
+    """Case-fold text the way re.IGNORECASE compares it to ASCII literals.
+
+    The result has the same length as text, so offsets found in it are
+    offsets in text, and an ASCII string occurs in it exactly where the
+    string matches text case-insensitively.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Lowercased text with IGNORECASE's ASCII equivalents substituted
+    """
+    if text.isascii():
+        return text.lower()
+    return text.translate(_IGNORECASE_FOLD).lower()
+
+
+def _find_all(needle: str, text: str) -> list[int]:
+    """Return the start offset of every occurrence of needle in text.
+
+    Args:
+        needle: String to locate
+        text: Text to search
+
+    Returns:
+        Ascending list of offsets (occurrences may overlap)
+    """
+    offsets: list[int] = []
+    pos = text.find(needle)
+    while pos != -1:
+        offsets.append(pos)
+        pos = text.find(needle, pos + 1)
+    return offsets
+
+
+def _find_spans(
+    rule: _PatternRule, text: str, text_lower: str
+) -> list[tuple[int, int]]:
+    """Find non-overlapping match spans of a rule's pattern in text.
+
+    Literal patterns are located in the case-folded copy with str.find and
+    other patterns are only tried where a prefix occurs; patterns with
+    neither are run with the regex alone.
+
+    Args:
+        rule: Pattern rule to match
+        text: Text to search
+        text_lower: Case-folded text (see _fold_case)
+
+    Returns:
+        List of (start, end) spans in ascending order
+    """
+    if not (rule.literals or rule.prefixes):
+        return [match.span() for match in rule.regex.finditer(text)]
+
+    spans: list[tuple[int, int]] = []
+    if rule.literals:
+        # Literals never overlap one another (see _compile_rule), so each
+        # is located independently
+        for needle in rule.literals:
+            pos = text_lower.find(needle)
+            while pos != -1:
+                spans.append((pos, pos + len(needle)))
+                pos = text_lower.find(needle, pos + len(needle))
+        spans.sort()
+        return spans
+
+    # Every match starts at a prefix, so trying each prefix offset in order
+    # (skipping those inside the previous match) finds exactly the matches
+    # finditer would
+    candidates = sorted(
+        pos for prefix in rule.prefixes for pos in _find_all(prefix, text_lower)
+    )
+    resume = 0
+    for pos in candidates:
+        if pos < resume:
+            continue
+        match = rule.regex.match(text, pos)
+        if match is not None:
+            spans.append(match.span())
+            resume = match.end()
+    return spans
+
+
+# Most alternative strings an anchor set may hold; longer cross products of
+# fixed text are split into separate candidates
+_MAX_ANCHOR_ALTERNATIVES = 16
+
+
+def _has_scoped_flags(subpattern: tuple[Any, ...]) -> bool:
+    """Check whether a parsed group sets or clears inline flags.
+
+    A group such as (?-i:DAN) is matched case-sensitively, so its text is
+    not interchangeable with the lowercased literals the shortcuts search
+    for; such groups are left to the regex.
+
+    Args:
+        subpattern: Arguments of a parsed SUBPATTERN item
+            (group, add_flags, del_flags, items)
+
+    Returns:
+        True if the group adds or removes any flag
+    """
+    return bool(subpattern[1] or subpattern[2])
+
+
+def _fixed_strings(items: Iterable[tuple[Any, Any]]) -> tuple[str, ...] | None:
+    """Return every string a parsed pattern fragment can match, if finitely few.
+
+    Args:
+        items: Parsed pattern items (from re's parser)
+
+    Returns:
+        The strings the fragment matches, or None if it matches anything
+        other than fixed text (classes, repeats, anchors, ...), has scoped
+        inline flags such as (?-i:...), or matches too many strings
+    """
+    strings: tuple[str, ...] = ("",)
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            part: tuple[str, ...] | None = (chr(av),)
+        elif op is sre_constants.SUBPATTERN and not _has_scoped_flags(av):
+            part = _fixed_strings(av[-1])
+        elif op is sre_constants.BRANCH:
+            branches = [_fixed_strings(branch) for branch in av[1]]
+            part = None
+            if all(branch is not None for branch in branches):
+                part = tuple(
+                    dict.fromkeys(s for branch in branches if branch for s in branch)
+                )
+        else:
+            return None
+        if part is None or len(strings) * len(part) > _MAX_ANCHOR_ALTERNATIVES:
+            return None
+        strings = tuple(a + b for a in strings for b in part)
+    return strings
+
+
+def _required_literals(items: Iterable[tuple[Any, Any]]) -> tuple[str, ...]:
+    """Derive anchors: literals at least one of which occurs in every match.
+
+    Runs of fixed text (literals, and groups or alternations of literals)
+    are candidates, as are the anchors of nested groups, alternations whose
+    every branch has anchors, and repeats that must match at least once.
+    The candidate whose shortest string is longest is chosen.
+
+    Args:
+        items: Parsed pattern items (from re's parser)
+
+    Returns:
+        Lowercased ASCII anchors, or an empty tuple if none could be derived
+    """
+    candidates: list[tuple[str, ...]] = []
+    run: tuple[str, ...] = ("",)
+    for op, av in items:
+        fixed = _fixed_strings([(op, av)])
+        if fixed is not None:
+            if len(run) * len(fixed) <= _MAX_ANCHOR_ALTERNATIVES:
+                run = tuple(a + b for a in run for b in fixed)
+            else:
+                candidates.append(run)
+                run = fixed
+            continue
+
+        candidates.append(run)
+        run = ("",)
+        if op is sre_constants.SUBPATTERN:
+            candidates.append(_required_literals(av[-1]))
+        elif op is sre_constants.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                candidates.append(
+                    tuple(dict.fromkeys(a for branch in branches for a in branch))
+                )
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0]:
+            candidates.append(_required_literals(av[2]))
+    candidates.append(run)
+
+    # Anchors are tested against case-folded text
+    usable = [anchors for anchors in map(_lowercase_ascii, candidates) if anchors]
+    return max(
+        usable,
+        key=lambda anchors: (min(map(len, anchors)), -len(anchors)),
+        default=(),
+    )
+
+
+def _leading_literals(items: Iterable[tuple[Any, Any]]) -> tuple[str, ...]:
+    """Derive literals that every match of a parsed pattern starts with.
+
+    Leading zero-width assertions such as \\b are skipped; a leading run of
+    fixed text gives the prefixes directly, and a leading group, alternation
+    or repeat is looked into.
+
+    Args:
+        items: Parsed pattern items (from re's parser)
+
+    Returns:
+        Prefix strings, or an empty tuple if none could be derived
+    """
+    prefixes: tuple[str, ...] = ("",)
+    for op, av in items:
+        if op is sre_constants.AT and prefixes == ("",):
+            continue
+
+        fixed = _fixed_strings([(op, av)])
+        if fixed is not None and len(prefixes) * len(fixed) <= _MAX_ANCHOR_ALTERNATIVES:
+            prefixes = tuple(a + b for a in prefixes for b in fixed)
+            continue
+
+        if prefixes == ("",):
+            if op is sre_constants.SUBPATTERN and not _has_scoped_flags(av):
+                return _leading_literals(av[-1])
+            if op is sre_constants.BRANCH:
+                branches = [_leading_literals(branch) for branch in av[1]]
+                if not all(branches):
+                    return ()
+                return tuple(dict.fromkeys(a for branch in branches for a in branch))
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0]:
+                return _leading_literals(av[2])
+        break
+
+    return () if prefixes == ("",) else prefixes
+
+
+def _lowercase_ascii(strings: tuple[str, ...] | None) -> tuple[str, ...]:
+    """Lowercase derived literals for searching case-folded text.
+
+    Args:
+        strings: Derived literal strings (None or empty if none)
+
+    Returns:
+        The lowercased strings, or an empty tuple if any is empty or not
+        ASCII (such literals cannot be searched for in folded text)
+    """
+    if not strings or not all(s and s.isascii() for s in strings):
+        return ()
+    return tuple(dict.fromkeys(s.lower() for s in strings))
+
+
+def _overlap_free(literals: tuple[str, ...]) -> bool:
+    """Check that no two distinct literals can match overlapping text.
+
+    When this holds, locating each literal independently with str.find
+    gives the same spans as scanning with the regex.
+
+    Args:
+        literals: Literal strings
+
+    Returns:
+        True if no literal contains another or has a suffix that another
+        starts with
+    """
+    for a in literals:
+        for b in literals:
+            if a == b:
+                continue
+            if a in b or any(b.startswith(a[i:]) for i in range(1, len(a))):
+                return False
+    return True
+
+
+def _compile_rule(
+    pattern: str, flags: int, threat_level: ThreatLevel, description: str
+) -> _PatternRule:
+    """Compile one pattern and derive its anchors, literals and prefixes.
+
+    Anchors are derived from the pattern's parsed source, so they cannot
+    fall out of step with the pattern; a pattern with no derivable anchor is
+    simply never skipped. Patterns that only match a few fixed strings skip
+    the regex engine. Under re.IGNORECASE the regex engine
+    gets no literal prefix to skip ahead to and tries a match at every
+    position, so other patterns with derivable prefixes are only tried
+    where a prefix occurs.
+
+    Args:
+        pattern: Pattern source
+        flags: Regex flags (re.IGNORECASE is always added)
+        threat_level: Severity of a match
+        description: Human-readable description (empty: described by the
+            matched text)
+
+    Returns:
+        Compiled rule
+    """
+    parsed = sre_parse.parse(pattern, flags | re.IGNORECASE)
+
+    literals = _lowercase_ascii(_fixed_strings(parsed))
+    if not _overlap_free(literals):
+        literals = ()
+
+    return _PatternRule(
+        pattern=pattern,
+        regex=re.compile(pattern, flags | re.IGNORECASE),
+        threat_level=threat_level,
+        description=description,
+        anchors=_required_literals(parsed),
+        literals=literals,
+        prefixes=() if literals else _lowercase_ascii(_leading_literals(parsed)),
+    )
+
+
+def _compile_rules(cls: type[SkillSecurityValidator]) -> None:
+    """Compile a validator class's pattern tables into rules.
+
+    Runs once per class at import (or subclass creation) time. Validators
+    are created per skill, so compiling in __init__ (or relying on the
+    bounded re module cache on every call) would repeat the same work for
+    every skill loaded.
+
+    Each pattern keeps its own compiled regex rather than being merged into
+    one named-group alternation. The re module is a backtracking engine, so
+    an alternation still tries every branch at every position; it also
+    reports only one match per span, hiding overlapping hits from other
+    patterns.
+
+    Args:
+        cls: Validator class to compile rules for
+    """
+    cls._injection_rules = tuple(
+        _compile_rule(pattern, re.MULTILINE, threat_level, "")
+        for pattern, threat_level in cls.INJECTION_PATTERNS.items()
+    )
+    cls._suspicious_rules = tuple(
+        _compile_rule(pattern, 0, ThreatLevel.SUSPICIOUS, description)
+        for pattern, description in cls.SUSPICIOUS_PATTERNS.items()
+    )
+
+    rules = cls._injection_rules + cls._suspicious_rules
+    cls._trigger_hints = frozenset(a for rule in rules for a in rule.anchors)
+    cls._fully_anchored = all(rule.anchors for rule in rules)
+
+
+_compile_rules(SkillSecurityValidator)
+
+# Characters encoded per hasher update when computing scan cache keys
+_HASH_CHUNK_SIZE = 8192
+
+# Content up to this many characters is used as its own cache key
+_INLINE_KEY_SIZE = 1024
+
+# Maximum number of scan results cached per validator
+_SCAN_CACHE_SIZE = 4096
+
+
+def _scan_cache_key(instructions: str) -> str | tuple[int, bytes]:
+    """Build the scan cache key for a skill's instructions.
+
+    Small content is its own key: str hashes are cached on the object, so
+    the lookup costs less than encoding and digesting the text, and at most
+    _INLINE_KEY_SIZE characters per entry stay pinned. Larger content is
+    keyed by (length, BLAKE2b digest) so the cache never holds full skill
+    bodies.
+
+    Args:
+        instructions: Skill instructions
+
+    Returns:
+        Cache key for the content
+    """
+    if len(instructions) <= _INLINE_KEY_SIZE:
+        return instructions
+
+    hasher = hashlib.blake2b(digest_size=16)
+    # Hash in fixed-size chunks so no full encoded copy is built
+    for start in range(0, len(instructions), _HASH_CHUNK_SIZE):
+        chunk = instructions[start : start + _HASH_CHUNK_SIZE]
+        hasher.update(chunk.encode("utf-8", "surrogatepass"))
+    return (len(instructions), hasher.digest())
@@ -1,32 +1,61 @@
 """Validator for skill files and data structures."""
 
+import copy
 import logging
 import re
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from itertools import islice
 from pathlib import Path
+from typing import Any, Final
 
 import yaml
 
 from mcp_skills.models.skill import Skill
 
 
-logger = logging.getLogger(__name__)
-
+# Prefer the libyaml-backed loader (bundled with most PyYAML wheels); it
+# parses several times faster than the pure-Python SafeLoader. The two do not
+# accept exactly the same input (libyaml allows trailing tabs after plain
+# scalars, for one), so all frontmatter goes through load_frontmatter_yaml()
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-class SkillValidator:
-    """Validator for skill files and data structures.
 
-    Handles all validation logic for skills including:
-    - File format validation (YAML frontmatter)
-    - Required field validation
-    - Content length validation
-    - Category validation
-    - Format validation (skill IDs, paths)
-    - Business rule validation
-    """
+logger = logging.getLogger(__name__)
 
-    # Predefined skill categories
-    VALID_CATEGORIES = {
+# Patterns compiled once at import rather than looked up in the re module
+# cache on every call
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+_FENCE_TAIL_RE = re.compile(r"\s*\n")
+_NON_ID_CHAR_RE = re.compile(r"[^a-z0-9/]")
+# ASCII translation table equivalent to _NON_ID_CHAR_RE.sub("-", ...); every
+# codepoint is mapped so str.translate can take its all-ASCII fast path
+_ID_CHAR_TABLE = {
+    code: chr(code) if chr(code) in "abcdefghijklmnopqrstuvwxyz0123456789/" else "-"
+    for code in range(128)
+}
+_HYPHEN_RUN_RE = re.compile(r"-+")
+_EXAMPLES_SECTION_RE = re.compile(
+    r"##\s+Examples?\s*\n(.*?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL
+)
+_CODE_BLOCK_RE = re.compile(r"```[\w]*\n(.*?)\n```", re.DOTALL)
+
+# Frontmatter belongs at the top of the file; a block whose closing fence does
+# not end within these limits is not frontmatter, so parse_frontmatter can stop
+# reading there instead of reading on
+_MAX_FRONTMATTER_LINES = 200
+_MAX_FRONTMATTER_CHARS = 16 * 1024
+
+# Entries kept in each validator's parse_frontmatter cache
+_FRONTMATTER_CACHE_SIZE = 1024
+
+# Predefined skill categories
+_VALID_CATEGORIES: Final[frozenset[str]] = frozenset(
+    {
         "testing",
         "debugging",
         "refactoring",
@@ -39,6 +68,67 @@ class SkillValidator:
         "code-review",
         "collaboration",
     }
+)
+_VALID_CATEGORIES_TEXT: Final[str] = ", ".join(sorted(_VALID_CATEGORIES))
+
+# Minimum stripped lengths for required text fields: (field, minimum, error
+# code, error message template)
+_MIN_LENGTHS: Final[tuple[tuple[str, int, str, str], ...]] = (
+    ("name", 1, "name_missing", "Missing required field: name"),
+    (
+        "description",
+        10,
+        "description_too_short",
+        "Description too short ({length} chars, minimum {minimum})",
+    ),
+    (
+        "instructions",
+        50,
+        "instructions_too_short",
+        "Instructions too short ({length} chars, minimum {minimum})",
+    ),
+)
+
+
+def load_frontmatter_yaml(text: str) -> Any:
+    """Load SKILL.md frontmatter YAML with the shared safe loader.
+
+    Every code path that reads frontmatter uses this function so that a
+    skill found during discovery also loads, and vice versa.
+
+    Args:
+        text: YAML text between the frontmatter fences
+
+    Returns:
+        Loaded YAML data
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    return yaml.load(text, Loader=SafeLoader)
+
+
+class SkillValidator:
+    """Validator for skill files and data structures.
+
+    Handles all validation logic for skills including:
+    - File format validation (YAML frontmatter)
+    - Required field validation
+    - Content length validation
+    - Category validation
+    - Format validation (skill IDs, paths)
+    - Business rule validation
+    """
+
+    # Predefined skill categories (immutable; shared with SkillManager)
+    VALID_CATEGORIES: frozenset[str] = _VALID_CATEGORIES
+
+    def __init__(self) -> None:
+        """Initialize validator with an empty frontmatter cache."""
+        # LRU cache of loaded frontmatter keyed by the frontmatter text;
+        # callers always receive deep copies of cached values
+        self._frontmatter_cache: OrderedDict[str, dict | None] = OrderedDict()
+        self._frontmatter_cache_lock = threading.Lock()
 
     def validate_skill(self, skill: Skill) -> dict[str, list[str]]:
         """Check skill structure and dependencies.
@@ -53,21 +143,24 @@ class SkillValidator:
             Dictionary with validation results:
             {
                 "errors": ["Critical errors that prevent skill usage"],
-                "warnings": ["Non-critical warnings for improvement"]
+                "warnings": ["Non-critical warnings for improvement"],
+                "error_codes": ["Stable code for each error, in order"],
+                "warning_codes": ["Stable code for each warning, in order"]
             }
 
-        Validation Rules:
+        Validation Rules (codes in brackets):
         - ERRORS (critical):
-            - Missing required fields: name, description, instructions
+            - Missing required fields: name [name_missing]
             - Invalid YAML frontmatter
-            - Description too short (<10 chars)
-            - Instructions too short (<50 chars)
+            - Description too short (<10 chars) [description_too_short]
+            - Instructions too short (<50 chars) [instructions_too_short]
 
         - WARNINGS (non-critical):
-            - Unknown category (not in VALID_CATEGORIES)
-            - Missing tags
-            - Missing examples in instructions
+            - Unknown category (not in VALID_CATEGORIES) [unknown_category]
+            - Missing tags [missing_tags]
+            - Missing examples in instructions [missing_examples]
             - Unresolved dependencies (requires dependency_resolver callback)
+              [unresolved_dependency]
 
         Example:
             >>> validator = SkillValidator()
@@ -76,48 +169,97 @@ class SkillValidator:
             ['Description too short (5 chars, minimum 10)']
             >>> result["warnings"]
             ['Unknown category: invalid-cat']
+            >>> result["error_codes"]
+            ['description_too_short']
+        """
+        return self.validate_skill_fields(
+            name=skill.name,
+            description=skill.description,
+            instructions=skill.instructions,
+            category=skill.category,
+            tags=skill.tags,
+            examples=skill.examples,
+        )
+
+    def validate_skill_fields(
+        self,
+        *,
+        name: str,
+        description: str,
+        instructions: str,
+        category: str,
+        tags: list[str] | None = None,
+        examples: list[str] | None = None,
+    ) -> dict[str, list[str]]:
+        """Check skill structure from individual field values.
+
+        Applies the same rules as validate_skill without needing a Skill
+        object, e.g. for values taken straight from parsed frontmatter.
+
+        Args:
+            name: Skill name
+            description: Skill description
+            instructions: Skill instructions markdown
+            category: Skill category
+            tags: Skill tags
+            examples: Examples already extracted from the instructions
+
+        Returns:
+            Dictionary with validation results, as for validate_skill
         """
         errors: list[str] = []
         warnings: list[str] = []
+        error_codes: list[str] = []
+        warning_codes: list[str] = []
 
         # Check required fields
-        if not skill.name or len(skill.name.strip()) == 0:
-            errors.append("Missing required field: name")
-
-        if not skill.description or len(skill.description.strip()) < 10:
-            errors.append(
-                f"Description too short ({len(skill.description)} chars, minimum 10)"
-            )
-
-        if not skill.instructions or len(skill.instructions.strip()) < 50:
-            errors.append(
-                f"Instructions too short ({len(skill.instructions)} chars, minimum 50)"
-            )
+        values = {
+            "name": name,
+            "description": description,
+            "instructions": instructions,
+        }
+        for field, minimum, code, message in _MIN_LENGTHS:
+            value = values[field] or ""
+            if len(value.strip()) < minimum:
+                errors.append(message.format(length=len(value), minimum=minimum))
+                error_codes.append(code)
 
         # Validate category
-        if skill.category not in self.VALID_CATEGORIES:
+        if category not in _VALID_CATEGORIES:
             warnings.append(
-                f"Unknown category: {skill.category}. "
-                f"Valid categories: {', '.join(sorted(self.VALID_CATEGORIES))}"
+                f"Unknown category: {category}. "
+                f"Valid categories: {_VALID_CATEGORIES_TEXT}"
             )
+            warning_codes.append("unknown_category")
 
         # Check tags
-        if not skill.tags or len(skill.tags) == 0:
+        if not tags:
             warnings.append("No tags specified. Tags improve discoverability.")
+            warning_codes.append("missing_tags")
 
-        # Check for examples in instructions (basic heuristic)
-        instructions_lower = skill.instructions.lower()
+        # Check for examples: reuse those already extracted at load time,
+        # otherwise fall back to a basic heuristic over the instructions
         has_examples = (
-            "example" in instructions_lower
-            or "usage" in instructions_lower
-            or "```" in skill.instructions  # Code blocks often indicate examples
+            bool(examples)
+            or "```" in instructions  # Code blocks often indicate examples
         )
+        if not has_examples:
+            instructions_lower = instructions.lower()
+            has_examples = (
+                "example" in instructions_lower or "usage" in instructions_lower
+            )
         if not has_examples:
             warnings.append(
                 "No examples found in instructions. Consider adding usage examples."
             )
+            warning_codes.append("missing_examples")
 
-        return {"errors": errors, "warnings": warnings}
+        return {
+            "errors": errors,
+            "warnings": warnings,
+            "error_codes": error_codes,
+            "warning_codes": warning_codes,
+        }
 
     def validate_skill_with_dependencies(
         self, skill: Skill, dependency_resolver: Callable[[str], Skill | None]
@@ -136,16 +278,37 @@ class SkillValidator:
         """
         result = self.validate_skill(skill)
 
-        # Validate dependencies (check if they can be resolved)
+        # Validate dependencies (check if they can be resolved); each distinct
+        # ID is resolved once, in order, since resolving may load from disk
         if skill.dependencies:
-            for dep_id in skill.dependencies:
+            for dep_id in dict.fromkeys(skill.dependencies):
                 # Check if dependency exists using the provided resolver
                 dep_skill = dependency_resolver(dep_id)
                 if not dep_skill:
                     result["warnings"].append(f"Unresolved dependency: {dep_id}")
+                    result["warning_codes"].append("unresolved_dependency")
 
         return result
 
+    def validate_skills(self, skills: Iterable[Skill]) -> list[dict[str, list[str]]]:
+        """Check structure of several skills at once.
+
+        Convenience for bulk callers such as repository indexing; each
+        result is the same as validate_skill would return for that skill.
+
+        Args:
+            skills: Skill objects to validate
+
+        Returns:
+            List of validation results, in the same order as skills
+
+        Example:
+            >>> results = validator.validate_skills(skills)
+            >>> invalid = [s for s, r in zip(skills, results) if r["errors"]]
+        """
+        validate = self.validate_skill
+        return [validate(skill) for skill in skills]
+
     def split_frontmatter(self, content: str) -> tuple[str, str]:
         """Split SKILL.md content into frontmatter and instructions.
 
@@ -164,21 +327,92 @@ class SkillValidator:
         Returns:
             Tuple of (frontmatter_yaml, instructions_markdown)
         """
-        # Match YAML frontmatter between --- markers
-        frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        fences = self._scan_fences(content)
 
-        if match:
-            return match.group(1), match.group(2)
+        if fences:
+            start, end, body_start = fences
+            return content[start:end], content[body_start:]
 
         # No frontmatter found
         return "", content
 
+    @staticmethod
+    def _scan_fences(text: str) -> tuple[int, int, int] | None:
+        """Locate the YAML frontmatter between --- markers.
+
+        Shared by split_frontmatter and the parse_frontmatter methods so
+        they all agree on where the frontmatter block starts and ends, and
+        on the size limits: the closing fence must end within the first
+        200 lines after the opening fence and the first 16KB of text.
+
+        Args:
+            text: SKILL.md content starting at the opening --- marker
+
+        Returns:
+            Tuple of (frontmatter start, frontmatter end, instructions start)
+            offsets, or None if the text has no frontmatter block
+        """
+        fences = SkillValidator._find_fences(text)
+        if fences is None:
+            return None
+
+        # The closing --- line ends at the first newline after the marker
+        close = text.index("\n", fences[1] + 4) + 1
+        if (
+            close > _MAX_FRONTMATTER_CHARS
+            or text.count("\n", 0, close) > _MAX_FRONTMATTER_LINES + 1
+        ):
+            return None
+        return fences
+
+    @staticmethod
+    def _find_fences(text: str) -> tuple[int, int, int] | None:
+        """Locate the --- markers of a frontmatter block, regardless of size.
+
+        Args:
+            text: SKILL.md content starting at the opening --- marker
+
+        Returns:
+            Tuple of (frontmatter start, frontmatter end, instructions start)
+            offsets, or None if the text has no frontmatter block
+        """
+        if not text.startswith("---"):
+            return None
+
+        # Common case: "---" on its own line followed directly by content.
+        # Plain substring search finds the same closing fence as the regex
+        # without stepping through the frontmatter character by character.
+        if text.startswith("---\n") and not text[4:5].isspace():
+            end = text.find("\n---", 4)
+            while end != -1:
+                tail = _FENCE_TAIL_RE.match(text, end + 4)
+                if tail:
+                    return 4, end, tail.end()
+                end = text.find("\n---", end + 1)
+            return None
+
+        # Whitespace after the opening fence (blank lines, CRLF): use the regex
+        match = _FRONTMATTER_RE.match(text)
+        if not match:
+            return None
+        return match.start(1), match.end(1), match.start(2)
+
     def parse_frontmatter(self, file_path: Path) -> dict | None:
         """Parse YAML frontmatter from SKILL.md file.
 
         This is a faster alternative to full file parsing when only
-        metadata is needed.
+        metadata is needed: the file is read line by line and reading stops
+        at the closing --- fence, so the instructions body is never loaded.
+
+        The opening --- must be the first line and the block ends at the
+        next line consisting of --- (trailing whitespace allowed); the lines
+        read are then split with the same fence rules and size limits as
+        split_frontmatter, so reading stops after 200 lines or 16KB and a
+        file missing its closing fence is not read to the end.
+
+        Loaded results are cached per validator, keyed by the frontmatter
+        text read, so YAML is only parsed again when the frontmatter itself
+        changes.
 
         Args:
             file_path: Path to SKILL.md file
@@ -187,19 +421,123 @@ class SkillValidator:
             Dictionary with frontmatter data or None if parsing fails
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            frontmatter, _ = self.split_frontmatter(content)
-
-            if not frontmatter:
+            block = self._read_frontmatter(file_path)
+            if block is None:
                 return None
 
-            metadata = yaml.safe_load(frontmatter)
-            return metadata if isinstance(metadata, dict) else None
+            with self._frontmatter_cache_lock:
+                hit = block in self._frontmatter_cache
+                if hit:
+                    self._frontmatter_cache.move_to_end(block)
+                    cached = self._frontmatter_cache[block]
+
+            if hit:
+                return copy.deepcopy(cached)
+
+            metadata = self._load_frontmatter(block)
 
         except (yaml.YAMLError, OSError) as e:
             logger.error(f"Failed to parse frontmatter from {file_path}: {e}")
             return None
 
+        with self._frontmatter_cache_lock:
+            self._frontmatter_cache[block] = copy.deepcopy(metadata)
+            if len(self._frontmatter_cache) > _FRONTMATTER_CACHE_SIZE:
+                self._frontmatter_cache.popitem(last=False)
+
+        return metadata
+
+    def _read_frontmatter(self, file_path: Path) -> str | None:
+        """Read the frontmatter block of a file, including its --- fences.
+
+        Args:
+            file_path: Path to SKILL.md file
+
+        Returns:
+            The lines from the opening to the closing fence, or None if the
+            file has no complete frontmatter block
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with file_path.open(encoding="utf-8") as handle:
+            # Most files without frontmatter are rejected on the first
+            # three characters, before a whole line is read
+            opening = handle.read(3)
+            if opening != "---":
+                return None
+
+            lines = [opening + handle.readline(_MAX_FRONTMATTER_CHARS)]
+            if lines[0].rstrip() != "---":
+                return None
+
+            # As in split_frontmatter, the closing fence must end its line
+            # and cannot be the first non-blank line of the block
+            has_content = False
+            closed = False
+            remaining = _MAX_FRONTMATTER_CHARS - len(lines[0])
+            for _ in range(_MAX_FRONTMATTER_LINES):
+                line = handle.readline(remaining)
+                if not line:
+                    return None  # No closing fence
+                lines.append(line)
+                if has_content and line.endswith("\n") and line.rstrip() == "---":
+                    closed = True
+                    break
+                has_content = has_content or not line.isspace()
+                remaining -= len(line)
+                if remaining <= 0:
+                    break
+
+            if not closed:
+                logger.warning(
+                    f"No closing frontmatter fence within the first "
+                    f"{_MAX_FRONTMATTER_LINES} lines or "
+                    f"{_MAX_FRONTMATTER_CHARS} characters of {file_path}"
+                )
+                return None
+
+        return "".join(lines)
+
+    def parse_frontmatter_text(self, content: str) -> dict | None:
+        """Parse YAML frontmatter from SKILL.md content already in memory.
+
+        Args:
+            content: Full or leading SKILL.md content
+
+        Returns:
+            Dictionary with frontmatter data or None if parsing fails
+        """
+        try:
+            return self._load_frontmatter(content)
+        except yaml.YAMLError as e:
+            logger.error(f"Failed to parse frontmatter: {e}")
+            return None
+
+    def _load_frontmatter(self, content: str) -> dict | None:
+        """Load the frontmatter block of content as YAML.
+
+        Args:
+            content: SKILL.md content starting at the opening --- marker
+
+        Returns:
+            Dictionary with frontmatter data, or None if there is no
+            frontmatter block or it is not a mapping
+
+        Raises:
+            yaml.YAMLError: If the frontmatter is not valid YAML
+        """
+        fences = self._scan_fences(content)
+        if not fences:
+            return None
+
+        frontmatter = content[fences[0] : fences[1]]
+        if not frontmatter:
+            return None
+
+        metadata = load_frontmatter_yaml(frontmatter)
+        return metadata if isinstance(metadata, dict) else None
+
     def normalize_skill_id(self, skill_id: str) -> str:
         """Normalize skill ID to lowercase with hyphens.
 
@@ -216,11 +554,16 @@ class SkillValidator:
         # Convert to lowercase
         normalized = skill_id.lower()
 
-        # Replace special characters (except /) with hyphens
-        normalized = re.sub(r"[^a-z0-9/]", "-", normalized)
+        # Replace special characters (except /) with hyphens; the lookup
+        # table only covers ASCII, so other IDs go through the regex
+        if normalized.isascii():
+            normalized = normalized.translate(_ID_CHAR_TABLE)
+        else:
+            normalized = _NON_ID_CHAR_RE.sub("-", normalized)
 
-        # Remove consecutive hyphens
-        normalized = re.sub(r"-+", "-", normalized)
+        # Remove consecutive hyphens (most IDs have none to collapse)
+        if "--" in normalized:
+            normalized = _HYPHEN_RUN_RE.sub("-", normalized)
 
         # Remove leading/trailing hyphens
         normalized = normalized.strip("-")
@@ -249,19 +592,16 @@ class SkillValidator:
         examples: list[str] = []
 
         # Look for "Examples" section (case-insensitive)
-        examples_pattern = r"##\s+Examples?\s*\n(.*?)(?=\n##|\Z)"
-        match = re.search(examples_pattern, instructions, re.IGNORECASE | re.DOTALL)
+        match = _EXAMPLES_SECTION_RE.search(instructions)
 
         if match:
             examples_text = match.group(1).strip()
             if examples_text:
                 examples.append(examples_text)
 
-        # Also extract code blocks as examples
-        code_block_pattern = r"```[\w]*\n(.*?)\n```"
-        code_blocks = re.findall(code_block_pattern, instructions, re.DOTALL)
-
-        # Limit to first 3 code blocks to avoid bloat
-        examples.extend(code_blocks[:3])
+        # Also extract code blocks as examples, limited to the first 3 to
+        # avoid bloat; stop scanning once the limit is reached
+        for block in islice(_CODE_BLOCK_RE.finditer(instructions), 3):
+            examples.append(block.group(1))
 
         return examples
@@ -14,6 +14,7 @@ import pytest
 import yaml
 
 from mcp_skills.services.skill_builder import SkillBuilder
+from mcp_skills.services.validators import SkillValidator
 
 
 @pytest.fixture
@@ -274,6 +275,22 @@ description: broken yaml
         assert result.valid is False
         assert any("Invalid YAML syntax" in e for e in result.errors)
 
+    def test_validate_uses_discovery_yaml_loader(self, skill_builder):
+        """Test validation accepts the same frontmatter as skill discovery."""
+        # Trailing tabs are accepted by libyaml but not by pure-Python PyYAML
+        skill_content = (
+            "---\n"
+            "name: test-skill\t\n"
+            "description: This is a valid test skill for validation testing\n"
+            "---\n\n"
+            "# Test Skill\n\nValid skill content.\n"
+        )
+
+        result = skill_builder.validate_skill(skill_content)
+
+        assert SkillValidator().parse_frontmatter_text(skill_content) is not None
+        assert not any("Invalid YAML syntax" in e for e in result.errors)
+
     def test_validate_missing_required_fields(self, skill_builder):
         """Test validation fails without required fields."""
         skill_content = """---
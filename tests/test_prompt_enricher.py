@@ -68,72 +68,94 @@ def enricher(mock_skill_manager):
     return PromptEnricher(mock_skill_manager)
 
 
+@pytest.fixture(scope="module")
+def keyword_enricher():
+    """Create module-scoped PromptEnricher for pure keyword extraction tests."""
+    return PromptEnricher(MagicMock())
+
+
 class TestKeywordExtraction:
     """Test keyword extraction functionality."""
 
-    def test_extract_basic_keywords(self, enricher):
-        """Test basic keyword extraction."""
-        prompt = "Create a FastAPI endpoint with validation"
-        keywords = enricher.extract_keywords(prompt)
-
-        assert "fastapi" in keywords
-        assert "endpoint" in keywords
-        assert "validation" in keywords
-        assert "create" in keywords
-
-    def test_extract_removes_stop_words(self, enricher):
-        """Test that stop words are removed."""
-        prompt = "The API is for the user authentication"
-        keywords = enricher.extract_keywords(prompt)
-
-        assert "the" not in keywords
-        assert "is" not in keywords
-        assert "for" not in keywords
-        assert "api" in keywords
-        assert "user" in keywords
-        assert "authentication" in keywords
-
-    def test_extract_prioritizes_technical_terms(self, enricher):
+    @pytest.mark.parametrize(
+        "prompt,present,absent",
+        [
+            pytest.param(
+                "Create a FastAPI endpoint with validation",
+                ["fastapi", "endpoint", "validation", "create"],
+                [],
+                id="basic",
+            ),
+            pytest.param(
+                "The API is for the user authentication",
+                ["api", "user", "authentication"],
+                ["the", "is", "for"],
+                id="removes_stop_words",
+            ),
+            pytest.param(
+                'Create "user authentication" and "input validation" features',
+                ["user authentication", "input validation"],
+                [],
+                id="quoted_phrases",
+            ),
+            pytest.param(
+                "Implement testing and deploy to production",
+                ["implement", "testing", "deploy"],
+                [],
+                id="action_verbs",
+            ),
+        ],
+    )
+    def test_extract_keywords(
+        self,
+        keyword_enricher: PromptEnricher,
+        prompt: str,
+        present: list[str],
+        absent: list[str],
+    ):
+        """Test expected keywords are extracted and stop words are dropped."""
+        keywords = keyword_enricher.extract_keywords(prompt)
+
+        for word in present:
+            assert word in keywords
+        for word in absent:
+            assert word not in keywords
+
+    def test_extract_prioritizes_technical_terms(self, keyword_enricher):
         """Test that technical terms are prioritized."""
         prompt = "Create something with FastAPI and pytest"
-        keywords = enricher.extract_keywords(prompt)
+        keywords = keyword_enricher.extract_keywords(prompt)
 
         # Technical terms should come before regular words
         assert keywords.index("fastapi") < keywords.index("something")
         assert keywords.index("pytest") < keywords.index("something")
 
-    def test_extract_quoted_phrases(self, enricher):
-        """Test extraction of quoted phrases as single keywords."""
-        prompt = 'Create "user authentication" and "input validation" features'
-        keywords = enricher.extract_keywords(prompt)
-
-        assert "user authentication" in keywords
-        assert "input validation" in keywords
-
-    def test_extract_action_verbs(self, enricher):
-        """Test that action verbs are identified."""
-        prompt = "Implement testing and deploy to production"
-        keywords = enricher.extract_keywords(prompt)
-
-        assert "implement" in keywords
-        assert "testing" in keywords
-        assert "deploy" in keywords
-
-    def test_extract_empty_prompt(self, enricher):
+    def test_extract_empty_prompt(self, keyword_enricher):
         """Test extraction from empty prompt."""
-        keywords = enricher.extract_keywords("")
+        keywords = keyword_enricher.extract_keywords("")
         assert keywords == []
 
-    def test_extract_deduplicates(self, enricher):
+    def test_extract_deduplicates(self, keyword_enricher):
         """Test that duplicate keywords are removed."""
         prompt = "Create API endpoint create API create endpoint"
-        keywords = enricher.extract_keywords(prompt)
+        keywords = keyword_enricher.extract_keywords(prompt)
 
         # Should only appear once each
         assert keywords.count("api") == 1
         assert keywords.count("endpoint") == 1
         assert keywords.count("create") == 1
 
+    def test_extract_cached_result_not_shared(self, keyword_enricher):
+        """Test that repeated extraction returns independent lists."""
+        prompt = "Create FastAPI endpoint with validation"
+        first = keyword_enricher.extract_keywords(prompt)
+        first.append("mutated")
+
+        second = keyword_enricher.extract_keywords(prompt)
+
+        assert "mutated" not in second
+        assert second == first[:-1]
+
 
 class TestSkillSearch:
     """Test skill search functionality."""
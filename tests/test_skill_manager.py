@@ -611,11 +611,26 @@ class TestCacheManagement:
 
         assert len(skill_manager._skill_cache) > 0
         assert len(skill_manager._skill_paths) > 0
+        assert len(skill_manager._security_validators) > 0
 
         skill_manager.clear_cache()
 
         assert len(skill_manager._skill_cache) == 0
         assert len(skill_manager._skill_paths) == 0
+        assert len(skill_manager._security_validators) == 0
+
+    def test_security_validator_reused_per_trust_level(
+        self, skill_manager: SkillManager, sample_skill_file: Path
+    ) -> None:
+        """Test one security validator is kept per trust level."""
+        skill_manager.discover_skills()
+        validators = dict(skill_manager._security_validators)
+
+        skill_manager.discover_skills()
+
+        assert skill_manager._security_validators == validators
+        for trust_level, validator in validators.items():
+            assert validator.trust_level == trust_level
 
 
 class TestErrorHandling:
@@ -644,6 +659,49 @@ description: [unclosed array
         # Should skip malformed file
         assert len(skills) == 0
 
+    def test_frontmatter_loaders_agree(
+        self, temp_repos_dir: Path, sample_skill_file: Path
+    ) -> None:
+        """Test metadata-only and full loading accept the same frontmatter."""
+        # Trailing tabs are accepted by libyaml but not by pure-Python PyYAML
+        content = sample_skill_file.read_text(encoding="utf-8")
+        sample_skill_file.write_text(
+            content.replace("category: testing\n", "category: testing\t\n"),
+            encoding="utf-8",
+        )
+        skill_id = "test-repo/testing/pytest"
+
+        metadata = SkillManager(repos_dir=temp_repos_dir).get_skill_metadata(skill_id)
+        skill = SkillManager(repos_dir=temp_repos_dir).load_skill(skill_id)
+
+        assert metadata is not None
+        assert skill is not None
+        assert metadata.category == skill.category == "testing"
+
+    @pytest.mark.parametrize(("padding", "accepted"), [(150, True), (220, False)])
+    def test_frontmatter_loaders_agree_on_size_limit(
+        self,
+        temp_repos_dir: Path,
+        sample_skill_file: Path,
+        padding: int,
+        accepted: bool,
+    ) -> None:
+        """Test metadata-only and full loading apply the same size limit."""
+        content = sample_skill_file.read_text(encoding="utf-8")
+        sample_skill_file.write_text(
+            content.replace(
+                "author: Test Author\n", "author: Test Author\n" + "# note\n" * padding
+            ),
+            encoding="utf-8",
+        )
+        skill_id = "test-repo/testing/pytest"
+
+        metadata = SkillManager(repos_dir=temp_repos_dir).get_skill_metadata(skill_id)
+        skill = SkillManager(repos_dir=temp_repos_dir).load_skill(skill_id)
+
+        assert (metadata is not None) is accepted
+        assert (skill is not None) is accepted
+
     def test_parse_missing_frontmatter(
         self, skill_manager: SkillManager, temp_repos_dir: Path
     ) -> None:
@@ -7,9 +7,13 @@ Tests cover:
 - Example extraction
 """
 
+import os
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
+import yaml
 
 from mcp_skills.models.skill import Skill
 from mcp_skills.services.validators import SkillValidator
@@ -51,164 +55,134 @@ def test():
     return skill_file
 
 
+@pytest.fixture
+def make_skill() -> Callable[..., Skill]:
+    """Create a factory for valid Skill objects with per-test overrides.
+
+    Skill is a plain dataclass, so invalid overrides are not rejected at
+    construction and reach the validator unchanged.
+    """
+    defaults = {
+        "id": "test/skill",
+        "name": "test-skill",
+        "description": "Valid description here",
+        "instructions": "Long enough instructions " * 10,
+        "category": "testing",
+        "tags": ["test"],
+        "dependencies": [],
+        "examples": [],
+        "file_path": Path("/tmp/test.md"),
+        "repo_id": "test",
+    }
+
+    def _make_skill(**overrides: Any) -> Skill:
+        return Skill(**{**defaults, **overrides})
+
+    return _make_skill
+
+
 class TestSkillValidation:
     """Test skill validation methods."""
 
-    def test_validate_valid_skill(self, validator: SkillValidator) -> None:
+    def test_validate_valid_skill(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test validating a valid skill."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Long enough instructions " * 10,
-            category="testing",
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill()
 
         result = validator.validate_skill(skill)
 
         assert len(result["errors"]) == 0
+        assert result["error_codes"] == []
         # No warnings expected for valid skill with valid category
 
-    def test_validate_missing_name(self, validator: SkillValidator) -> None:
+    def test_validate_missing_name(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test validation fails for missing name."""
-        skill = Skill(
-            id="test/skill",
-            name="",
-            description="Valid description",
-            instructions="Long enough instructions " * 10,
-            category="testing",
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill(name="")
 
         result = validator.validate_skill(skill)
 
         assert len(result["errors"]) > 0
-        assert any("name" in error.lower() for error in result["errors"])
+        assert "name_missing" in result["error_codes"]
 
-    def test_validate_short_description(self, validator: SkillValidator) -> None:
+    def test_validate_short_description(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test validation fails for short description."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Short",  # Too short
-            instructions="Long enough instructions " * 10,
-            category="testing",
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill(description="Short")  # Too short
 
         result = validator.validate_skill(skill)
 
         assert len(result["errors"]) > 0
-        assert any("description" in error.lower() for error in result["errors"])
+        assert "description_too_short" in result["error_codes"]
 
-    def test_validate_short_instructions(self, validator: SkillValidator) -> None:
+    def test_validate_short_instructions(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test validation fails for short instructions."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Too short",  # Too short
-            category="testing",
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill(instructions="Too short")  # Too short
 
         result = validator.validate_skill(skill)
 
         assert len(result["errors"]) > 0
-        assert any("instructions" in error.lower() for error in result["errors"])
+        assert "instructions_too_short" in result["error_codes"]
 
-    def test_validate_invalid_category(self, validator: SkillValidator) -> None:
+    def test_validate_invalid_category(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test warning for invalid category."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Long enough instructions " * 10,
-            category="invalid-category",  # Invalid
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill(category="invalid-category")  # Invalid
 
         result = validator.validate_skill(skill)
 
         assert len(result["warnings"]) > 0
-        assert any("category" in warning.lower() for warning in result["warnings"])
+        assert "unknown_category" in result["warning_codes"]
 
-    def test_validate_missing_tags(self, validator: SkillValidator) -> None:
+    def test_validate_missing_tags(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test warning for missing tags."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Long enough instructions " * 10,
-            category="testing",
-            tags=[],  # No tags
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
-        )
+        skill = make_skill(tags=[])  # No tags
 
         result = validator.validate_skill(skill)
 
         assert len(result["warnings"]) > 0
-        assert any("tags" in warning.lower() for warning in result["warnings"])
+        assert "missing_tags" in result["warning_codes"]
 
-    def test_validate_missing_examples(self, validator: SkillValidator) -> None:
+    def test_validate_missing_examples(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
         """Test warning for missing examples."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Instructions without any specific demonstration patterns or code samples to show how to use this skill in practice.",
-            category="testing",
-            tags=["test"],
-            dependencies=[],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
+        skill = make_skill(
+            instructions="Instructions without any specific demonstration patterns or code samples to show how to use this skill in practice."
         )
 
         result = validator.validate_skill(skill)
 
         assert len(result["warnings"]) > 0
-        assert any("example" in warning.lower() for warning in result["warnings"])
+        assert "missing_examples" in result["warning_codes"]
 
-    def test_validate_with_dependencies(self, validator: SkillValidator) -> None:
-        """Test validation with dependency resolution."""
-        skill = Skill(
-            id="test/skill",
-            name="test-skill",
-            description="Valid description here",
-            instructions="Long enough instructions " * 10,
-            category="testing",
-            tags=["test"],
-            dependencies=["test/dependency"],
-            examples=[],
-            file_path=Path("/tmp/test.md"),
-            repo_id="test",
+    def test_validate_extracted_examples(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test examples extracted at load time satisfy the examples check."""
+        skill = make_skill(
+            instructions="Instructions without any specific demonstration patterns or code samples to show how to use this skill in practice.",
+            examples=["run-the-skill --now"],
         )
 
+        result = validator.validate_skill(skill)
+
+        assert "missing_examples" not in result["warning_codes"]
+
+    def test_validate_with_dependencies(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test validation with dependency resolution."""
+        skill = make_skill(dependencies=["test/dependency"])
+
         # Mock dependency resolver that returns None (unresolved)
         def mock_resolver(dep_id: str) -> Skill | None:
             return None
@@ -216,7 +190,73 @@ class TestSkillValidation:
         result = validator.validate_skill_with_dependencies(skill, mock_resolver)
 
         assert len(result["warnings"]) > 0
-        assert any("dependency" in warning.lower() for warning in result["warnings"])
+        assert "unresolved_dependency" in result["warning_codes"]
+
+    def test_validate_duplicate_dependencies(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test each distinct dependency is resolved and reported once."""
+        skill = make_skill(dependencies=["test/a", "test/b", "test/a", "test/b"])
+        resolved: list[str] = []
+
+        def resolver(dep_id: str) -> Skill | None:
+            resolved.append(dep_id)
+            return None
+
+        result = validator.validate_skill_with_dependencies(skill, resolver)
+
+        assert resolved == ["test/a", "test/b"]
+        assert result["warning_codes"].count("unresolved_dependency") == 2
+
+    def test_validate_codes_match_messages(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test there is one code per message, in the same order."""
+        skill = make_skill(
+            name="", description="Short", category="invalid-category", tags=[]
+        )
+
+        result = validator.validate_skill(skill)
+
+        assert result["error_codes"] == ["name_missing", "description_too_short"]
+        assert result["warning_codes"] == [
+            "unknown_category",
+            "missing_tags",
+            "missing_examples",
+        ]
+        assert len(result["errors"]) == len(result["error_codes"])
+        assert len(result["warnings"]) == len(result["warning_codes"])
+
+    def test_validate_skill_fields(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test validating raw field values matches validating a Skill."""
+        skill = make_skill(description="Short", category="invalid-category")
+
+        result = validator.validate_skill_fields(
+            name="test-skill",
+            description="Short",
+            instructions="Long enough instructions " * 10,
+            category="invalid-category",
+            tags=["test"],
+        )
+
+        assert result == validator.validate_skill(skill)
+        assert result["error_codes"] == ["description_too_short"]
+
+    def test_validate_skills_batch(
+        self, validator: SkillValidator, make_skill: Callable[..., Skill]
+    ) -> None:
+        """Test batch validation matches validating skills one at a time."""
+        skills = [
+            make_skill(id=f"test/skill-{i}", description="Short" if i % 3 else "")
+            for i in range(100)
+        ] + [make_skill(category="invalid-category")]
+
+        results = validator.validate_skills(iter(skills))
+
+        assert results == [validator.validate_skill(skill) for skill in skills]
+        assert len(results) == 101
 
 
 class TestFrontmatterParsing:
@@ -264,6 +304,17 @@ description: desc
         assert "name: test" in frontmatter
         assert "# Content" in instructions
 
+    def test_split_frontmatter_skips_non_fence_dashes(
+        self, validator: SkillValidator
+    ) -> None:
+        """Test lines that only start with --- do not close the frontmatter."""
+        content = "---\nname: test\n----\n--- x\nmore: y\n---  \n\n# Content"
+
+        frontmatter, instructions = validator.split_frontmatter(content)
+
+        assert frontmatter == "name: test\n----\n--- x\nmore: y"
+        assert instructions == "# Content"
+
     def test_parse_frontmatter_valid(
         self, validator: SkillValidator, temp_skill_file: Path
     ) -> None:
@@ -275,6 +326,69 @@ description: desc
         assert metadata["description"] == "Test skill description"
         assert metadata["category"] == "testing"
 
+    def test_parse_frontmatter_cached_hit(
+        self,
+        validator: SkillValidator,
+        temp_skill_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an unchanged file is parsed once and served from the cache."""
+        calls = 0
+        yaml_load = yaml.load
+
+        def counting_load(*args: Any, **kwargs: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            return yaml_load(*args, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        first = validator.parse_frontmatter(temp_skill_file)
+        assert first is not None
+        first["name"] = "mutated"
+        second = validator.parse_frontmatter(temp_skill_file)
+
+        assert calls == 1
+        # Each call returns an independent copy
+        assert second is not None
+        assert second["name"] == "test-skill"
+
+    def test_parse_frontmatter_cache_invalidated_on_change(
+        self, validator: SkillValidator, tmp_path: Path
+    ) -> None:
+        """Test a modified file is parsed again."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("---\nname: before\n---\n", encoding="utf-8")
+        assert validator.parse_frontmatter(skill_file) == {"name": "before"}
+
+        skill_file.write_text("---\nname: after-edit\n---\n", encoding="utf-8")
+
+        assert validator.parse_frontmatter(skill_file) == {"name": "after-edit"}
+
+    def test_parse_frontmatter_same_size_rewrite(
+        self, validator: SkillValidator, tmp_path: Path
+    ) -> None:
+        """Test a same-size edit within the mtime granularity is parsed again."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("---\nname: before\n---\n", encoding="utf-8")
+        stat = skill_file.stat()
+        assert validator.parse_frontmatter(skill_file) == {"name": "before"}
+
+        # Same size and modification time, as on a coarse-mtime filesystem
+        skill_file.write_text("---\nname: edited\n---\n", encoding="utf-8")
+        os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert skill_file.stat().st_size == stat.st_size
+
+        assert validator.parse_frontmatter(skill_file) == {"name": "edited"}
+
+    def test_parse_frontmatter_text_valid(self, validator: SkillValidator) -> None:
+        """Test parsing valid frontmatter from content."""
+        content = "---\nname: test\ntags: [a, b]\n---\n\n# Content"
+
+        metadata = validator.parse_frontmatter_text(content)
+
+        assert metadata == {"name": "test", "tags": ["a", "b"]}
+
     def test_parse_frontmatter_invalid_yaml(
         self, validator: SkillValidator, tmp_path: Path
     ) -> None:
@@ -294,6 +408,21 @@ description: [unclosed array
 
         assert metadata is None
 
+    def test_parse_frontmatter_text_invalid_yaml(
+        self, validator: SkillValidator
+    ) -> None:
+        """Test parsing invalid YAML from content."""
+        content = """---
+name: test
+description: [unclosed array
+---
+
+# Content"""
+
+        metadata = validator.parse_frontmatter_text(content)
+
+        assert metadata is None
+
     def test_parse_frontmatter_no_frontmatter(
         self, validator: SkillValidator, tmp_path: Path
     ) -> None:
@@ -305,6 +434,85 @@ description: [unclosed array
 
         assert metadata is None
 
+    def test_parse_frontmatter_text_no_frontmatter(
+        self, validator: SkillValidator
+    ) -> None:
+        """Test parsing content without frontmatter."""
+        metadata = validator.parse_frontmatter_text("# Just content\n\nNo frontmatter")
+
+        assert metadata is None
+
+    def test_parse_frontmatter_file_without_frontmatter(
+        self, validator: SkillValidator, tmp_path: Path
+    ) -> None:
+        """Test parsing files that do not open with a --- line."""
+        skill_file = tmp_path / "SKILL.md"
+
+        for content in ("# Just content\n", "--", "----\nname: test\n---\n"):
+            skill_file.write_text(content, encoding="utf-8")
+            assert validator.parse_frontmatter(skill_file) is None
+
+    def test_parse_frontmatter_unclosed(
+        self, validator: SkillValidator, tmp_path: Path
+    ) -> None:
+        """Test parsing frontmatter without a closing fence."""
+        skill_file = tmp_path / "unclosed.md"
+        skill_file.write_text("---\nname: test\n\n# Content\n", encoding="utf-8")
+
+        assert validator.parse_frontmatter(skill_file) is None
+
+    def test_parse_frontmatter_stops_at_closing_fence(
+        self, validator: SkillValidator, tmp_path: Path
+    ) -> None:
+        """Test that the body after the frontmatter is never read."""
+        skill_file = tmp_path / "SKILL.md"
+        # Undecodable bytes deep in the body would fail a full-file read
+        body = b"# Content\n" + b"x" * 100_000 + b"\xff\xfe\n"
+        skill_file.write_bytes(b"---\nname: test\n---\n\n" + body)
+
+        metadata = validator.parse_frontmatter(skill_file)
+
+        assert metadata == {"name": "test"}
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b"key: value\n" * 100_000,  # Too many lines
+            b"x" * 1_000_000,  # One oversized line
+        ],
+    )
+    def test_parse_frontmatter_runaway(
+        self, validator: SkillValidator, tmp_path: Path, body: bytes
+    ) -> None:
+        """Test that a missing closing fence stops reading at the size limit."""
+        skill_file = tmp_path / "SKILL.md"
+        # Undecodable bytes past the limit would fail if the file were read on
+        skill_file.write_bytes(b"---\n" + body + b"\xff\xfe\n---\n")
+
+        assert validator.parse_frontmatter(skill_file) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\nname: test\n---\n# Content\n",
+            "---  \n\nname: test\n---   \n\n# Content\n",
+            "---\n---\nname: test\n---\n# Content\n",
+            "---\n\n---\n# Content\n",
+            "---\nname: test\n---",
+        ],
+    )
+    def test_parse_frontmatter_matches_split(
+        self, validator: SkillValidator, tmp_path: Path, content: str
+    ) -> None:
+        """Test parse_frontmatter finds the same block as split_frontmatter."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text(content, encoding="utf-8")
+
+        frontmatter, _ = validator.split_frontmatter(content)
+        expected = yaml.safe_load(frontmatter) if frontmatter else None
+
+        assert validator.parse_frontmatter(skill_file) == expected
+
 
 class TestSkillIDNormalization:
     """Test skill ID normalization."""
@@ -330,6 +538,11 @@ class TestSkillIDNormalization:
         """Test leading/trailing hyphens are removed."""
         assert validator.normalize_skill_id("-test-") == "test"
 
+    def test_normalize_non_ascii(self, validator: SkillValidator) -> None:
+        """Test non-ASCII characters are replaced like other special chars."""
+        assert validator.normalize_skill_id("Café/Skill") == "caf-/skill"
+        assert validator.normalize_skill_id("naïve skill") == "na-ve-skill"
+
 
 class TestExampleExtraction:
     """Test example extraction from instructions."""
@@ -350,6 +563,16 @@ Example 2 content
         assert len(examples) > 0
         assert "Example 1 content" in examples[0]
 
+    def test_extract_examples_section_with_code_blocks(
+        self, validator: SkillValidator
+    ) -> None:
+        """Test code blocks inside the Examples section are also extracted."""
+        instructions = "## Examples\n\nRun:\n\n```bash\npytest\n```\n\n## Notes\n"
+
+        examples = validator.extract_examples(instructions)
+
+        assert examples == ["Run:\n\n```bash\npytest\n```", "pytest"]
+
     def test_extract_code_blocks(self, validator: SkillValidator) -> None:
         """Test extracting code blocks as examples."""
         instructions = """# Skill
@@ -423,6 +646,16 @@ block5
         # Should only extract first 3 code blocks
         assert len(examples) == 3
 
+    def test_extract_examples_keeps_first_code_blocks(
+        self, validator: SkillValidator
+    ) -> None:
+        """Test the first 3 code blocks are kept in document order."""
+        instructions = "".join(f"```\nblock{i}\n```\n\n" for i in range(1, 6))
+
+        examples = validator.extract_examples(instructions)
+
+        assert examples == ["block1", "block2", "block3"]
+
 
 class TestValidCategories:
     """Test valid categories definition."""
@@ -436,4 +669,4 @@ class TestValidCategories:
 
     def test_valid_categories_is_set(self, validator: SkillValidator) -> None:
         """Test that VALID_CATEGORIES is a set."""
-        assert isinstance(validator.VALID_CATEGORIES, set)
+        assert isinstance(validator.VALID_CATEGORIES, (set, frozenset))